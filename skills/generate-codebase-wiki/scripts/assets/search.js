@@ -2,70 +2,216 @@
  * Client-side full-text search for the wiki.
  *
  * Expected globals (injected by build_wiki.py):
- *   window.__wikiSearchIndex  – Array<{title, url, text}>
  *   window.__wikiBasePrefix   – String, e.g. "../" for subdirectory pages
+ *
+ * The index itself lives in search-index.js at the wiki root (shared by all
+ * pages) and is loaded on first use. It sets:
+ *   window.__wikiSearchIndex  – {titles: [], urls: [], texts: [], grams: {}}
+ *     titles/urls/texts hold one entry per page at the same position; grams
+ *     maps every lowercase 3-character substring to the ascending ids of the
+ *     pages whose title or text contains it, encoded as a string (see
+ *     _encode_postings in build_wiki.py).
  */
 (function () {
-  var searchIndex = window.__wikiSearchIndex || [];
+  var searchIndex = null;
+  var lowerTitles = [];
+  var lowerTexts = [];
+  var loading = false;
+  var timer = null;
+  var MAX_RESULTS = 10;
+  // Previous query and the ids of the pages it matched: a query containing
+  // it can only match a subset of those pages
+  var lastQ = "";
+  var lastIds = [];
   var basePrefix = window.__wikiBasePrefix || "";
   var input = document.getElementById("wiki-search");
   var results = document.getElementById("search-results");
   if (!input || !results) return;
 
-  input.addEventListener("input", function () {
-    var q = this.value.trim().toLowerCase();
+  // A <script> tag (unlike fetch) also works for wikis opened via file://
+  function loadIndex() {
+    if (searchIndex || loading) return;
+    loading = true;
+    var script = document.createElement("script");
+    script.src = basePrefix + "search-index.js";
+    script.onload = function () {
+      searchIndex = window.__wikiSearchIndex;
+      // Lowercase once here rather than per page on every search
+      lowerTitles = searchIndex.titles.map(function (t) {
+        return t.toLowerCase();
+      });
+      lowerTexts = searchIndex.texts.map(function (t) {
+        return t.toLowerCase();
+      });
+      search();
+    };
+    // Allow a retry on the next focus or keystroke instead of going silent
+    script.onerror = function () {
+      loading = false;
+      script.parentNode.removeChild(script);
+      results.innerHTML =
+        '<div class="search-no-results">Search index could not be loaded</div>';
+      results.className = "search-results visible";
+    };
+    document.head.appendChild(script);
+  }
+
+  var DIGITS =
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_";
+  var digitValue = {};
+  for (var d = 0; d < DIGITS.length; d++) digitValue[DIGITS.charAt(d)] = d;
+  var decoded = {}; // trigram -> decoded id list, filled on first use
+
+  // Ascending ids of the pages containing a trigram, or null if none do
+  function postings(gram) {
+    if (decoded[gram]) return decoded[gram];
+    var encoded = searchIndex.grams[gram];
+    if (!encoded) return null;
+    var ids = [];
+    var id = -1;
+    var gap = 0;
+    for (var i = 0; i < encoded.length; i++) {
+      var value = digitValue[encoded.charAt(i)];
+      if (value >= 32) {
+        gap = gap * 32 + value - 32; // more digits follow
+      } else {
+        id += gap * 32 + value + 1;
+        ids.push(id);
+        gap = 0;
+      }
+    }
+    return (decoded[gram] = ids);
+  }
+
+  // Merge two ascending id lists, keeping the ids present in both
+  function intersect(a, b) {
+    var out = [];
+    var i = 0;
+    var j = 0;
+    while (i < a.length && j < b.length) {
+      if (a[i] < b[j]) i++;
+      else if (a[i] > b[j]) j++;
+      else {
+        out.push(a[i]);
+        i++;
+        j++;
+      }
+    }
+    return out;
+  }
+
+  // Ids of the pages that contain every trigram of q (a superset of the
+  // actual matches), or null when q is too short to have trigrams.
+  // Array.from splits by code point, matching the Python side.
+  function candidates(q) {
+    var chars = Array.from(q);
+    if (chars.length < 3) return null;
+    var lists = [];
+    for (var i = 0; i + 3 <= chars.length; i++) {
+      var list = postings(chars[i] + chars[i + 1] + chars[i + 2]);
+      if (!list) return [];
+      lists.push(list);
+    }
+    lists.sort(function (a, b) {
+      return a.length - b.length;
+    });
+    var ids = lists[0];
+    for (var k = 1; k < lists.length && ids.length; k++) {
+      ids = intersect(ids, lists[k]);
+    }
+    return ids;
+  }
+
+  // Text around a match at idx (empty if the text does not match)
+  function buildSnippet(text, idx, q) {
+    if (idx === -1) return "";
+    var start = Math.max(0, idx - 40);
+    var end = Math.min(text.length, idx + q.length + 60);
+    return (
+      (start > 0 ? "..." : "") +
+      text.substring(start, end) +
+      (end < text.length ? "..." : "")
+    );
+  }
+
+  function search() {
+    var q = input.value.trim().toLowerCase();
     if (q.length < 2) {
       results.className = "search-results";
       results.innerHTML = "";
       return;
     }
+    if (!searchIndex) return; // re-run once the index has loaded
 
-    var matches = [];
-    for (var i = 0; i < searchIndex.length; i++) {
-      var page = searchIndex[i];
-      var titleMatch = page.title.toLowerCase().indexOf(q) !== -1;
-      var textMatch = page.text.toLowerCase().indexOf(q) !== -1;
-      if (titleMatch || textMatch) {
-        var snippet = "";
-        if (textMatch) {
-          var idx = page.text.toLowerCase().indexOf(q);
-          var start = Math.max(0, idx - 40);
-          var end = Math.min(page.text.length, idx + q.length + 60);
-          snippet =
-            (start > 0 ? "..." : "") +
-            page.text.substring(start, end) +
-            (end < page.text.length ? "..." : "");
+    var ids = lastQ && q.indexOf(lastQ) !== -1 ? lastIds : candidates(q);
+    var count = ids ? ids.length : searchIndex.titles.length;
+    var titleHits = []; // title matches are listed before text-only ones
+    var textHits = [];
+    var textOffsets = []; // where q occurs in the text of each text hit
+    var matchIds = [];
+    var complete = true;
+    for (var n = 0; n < count; n++) {
+      var i = ids ? ids[n] : n;
+      if (lowerTitles[i].indexOf(q) !== -1) {
+        titleHits.push(i);
+        matchIds.push(i);
+        // Enough title hits to fill the list: nothing later can outrank them
+        if (titleHits.length === MAX_RESULTS) {
+          complete = n + 1 === count;
+          break;
+        }
+      } else {
+        var offset = lowerTexts[i].indexOf(q);
+        if (offset !== -1) {
+          textHits.push(i);
+          textOffsets.push(offset);
+          matchIds.push(i);
         }
-        matches.push({
-          title: page.title,
-          url: basePrefix + page.url,
-          snippet: snippet,
-          titleMatch: titleMatch,
-        });
       }
     }
 
-    matches.sort(function (a, b) {
-      return (b.titleMatch ? 1 : 0) - (a.titleMatch ? 1 : 0);
-    });
+    // Only a full scan can seed the narrowing of the next query
+    lastQ = complete ? q : "";
+    lastIds = matchIds;
 
-    if (matches.length === 0) {
+    var shown = titleHits.concat(textHits).slice(0, MAX_RESULTS);
+    if (shown.length === 0) {
       results.innerHTML =
         '<div class="search-no-results">No results found</div>';
     } else {
       var html = "";
-      for (var j = 0; j < Math.min(matches.length, 10); j++) {
-        var m = matches[j];
-        html += '<a class="search-result-item" href="' + m.url + '">';
-        html += '<div class="search-result-title">' + m.title + "</div>";
-        if (m.snippet)
-          html +=
-            '<div class="search-result-snippet">' + m.snippet + "</div>";
+      for (var j = 0; j < shown.length; j++) {
+        var id = shown[j];
+        html +=
+          '<a class="search-result-item" href="' +
+          basePrefix +
+          searchIndex.urls[id] +
+          '">';
+        html +=
+          '<div class="search-result-title">' +
+          searchIndex.titles[id] +
+          "</div>";
+        // Text hits reuse the offset found while scanning; title hits
+        // never searched their text
+        var idx =
+          j < titleHits.length
+            ? lowerTexts[id].indexOf(q)
+            : textOffsets[j - titleHits.length];
+        var snippet = buildSnippet(searchIndex.texts[id], idx, q);
+        if (snippet)
+          html += '<div class="search-result-snippet">' + snippet + "</div>";
         html += "</a>";
       }
       results.innerHTML = html;
     }
     results.className = "search-results visible";
+  }
+
+  // Debounced: only search once typing pauses
+  input.addEventListener("input", function () {
+    loadIndex();
+    clearTimeout(timer);
+    timer = setTimeout(search, 100);
   });
 
   document.addEventListener("click", function (e) {
@@ -75,6 +221,7 @@
   });
 
   input.addEventListener("focus", function () {
+    loadIndex();
     if (this.value.trim().length >= 2)
       results.className = "search-results visible";
   });
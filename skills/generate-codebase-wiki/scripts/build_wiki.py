@@ -27,139 +27,317 @@ Examples:
 
     # Use a config file for hierarchical page ordering
     python build_wiki.py -i wiki/ --config wiki.json
+
+The script is pure Python with no required dependencies (``orjson`` is used
+when installed), so it also runs unchanged under PyPy 3.10+, whose JIT suits
+the string-heavy Markdown conversion of very large wikis:
+
+    pypy3 build_wiki.py -i wiki/ --config wiki.json
 """
 
 import argparse
+import functools
+import hashlib
+import itertools
 import json
+import os
 import re
+import string
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+try:  # optional: faster JSON encoding for the search index
+    import orjson
+except ImportError:
+    orjson = None
+
 # Directory containing static assets (CSS, JS, SVG) shipped alongside this script
 _ASSETS_DIR = Path(__file__).resolve().parent / "assets"
 
+# Below this many pages, worker start-up costs more than rendering in-process
+_PARALLEL_MIN_PAGES = 32
+
+# Threads used to write rendered pages to disk (I/O-bound, GIL released)
+_WRITE_THREADS = 8
+
+# Per-page input digests from the previous build, kept in the output directory
+_MANIFEST_NAME = ".build-manifest.json"
+
+# ---------------------------------------------------------------------------
+# Precompiled regular expressions (compiled once at import, reused per page)
+# ---------------------------------------------------------------------------
+
+# All inline rules as one alternation; earlier alternatives win at a position
+_RE_INLINE = re.compile(
+    r"`(?P<code>[^`]+)`"
+    r"|!\[(?P<alt>[^\]]*)\]\((?P<src>[^)]+)\)"
+    r"|\[(?P<text>[^\]]+)\]\((?P<href>[^)]+)\)"
+    r"|\*\*\*(?P<bi>.+?)\*\*\*"
+    r"|\*\*(?P<b>.+?)\*\*"
+    r"|\*(?P<i>.+?)\*"
+)
+_RE_LIST_ITEM = re.compile(r"([ \t]*)([*-]|\d+\.) (.+)")
+_RE_FENCE_LANG = re.compile(r"\w*")
+_RE_TABLE_SEP = re.compile(r"\|[-:| ]+\|")
+_RE_ESCAPED_DETAILS = re.compile(r"&lt;(/?(?:details|summary))&gt;")
+_RE_ANCHOR_STRIP = re.compile(r"[^\w\s-]")
+_RE_WS = re.compile(r"\s+")
+_RE_SLUG = re.compile(r"[^\w-]")
+# The same mapping as _RE_SLUG for ASCII text, as a bytes.translate table
+_SLUG_ASCII_TABLE = bytes(
+    c if chr(c).isalnum() or chr(c) in "-_" else ord("-") for c in range(256)
+)
+_RE_TITLE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_RE_CODEBLOCK_STRIP = re.compile(r"```[\s\S]*?```")
+# Runs of Markdown syntax and whitespace, collapsed to one space
+_RE_MD_SYNTAX = re.compile(r"[#*`\[\]()|>\s-]+")
+# Asset minification (comments and layout whitespace only)
+_RE_CSS_COMMENT = re.compile(r"/\*[\s\S]*?\*/")
+_RE_CSS_PUNCT = re.compile(r"\s*([{};,])\s*")
+_RE_JS_COMMENT_BLOCK = re.compile(r"^[ \t]*/\*[\s\S]*?\*/[ \t]*$", re.MULTILINE)
+
 
 # ---------------------------------------------------------------------------
 # Markdown -> HTML conversion (lightweight, no external dependencies)
 # ---------------------------------------------------------------------------
 
 
-def simple_md_to_html(md_content: str) -> str:
-    """Convert Markdown content to HTML (subset parser, no dependencies)."""
-    html = md_content
+@functools.lru_cache(maxsize=4096)
+def _anchorize(text: str) -> str:
+    """Turn heading text into the anchor id used for TOC links."""
+    anchor = _RE_ANCHOR_STRIP.sub("", text.lower())
+    return _RE_WS.sub("-", anchor).strip("-")
 
-    # Escape HTML characters first
-    html = html.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
-    # Restore <details> / <summary> blocks (commonly used in wiki pages)
-    for tag in ("details", "summary"):
-        html = html.replace(f"&lt;{tag}&gt;", f"<{tag}>")
-        html = html.replace(f"&lt;/{tag}&gt;", f"</{tag}>")
-
-    # Headers — also inject anchors for TOC linking
-    def _heading_replacer(level):
-        def _replacer(match):
-            text = match.group(1).strip()
-            anchor = re.sub(r"[^\w\s-]", "", text.lower())
-            anchor = re.sub(r"\s+", "-", anchor).strip("-")
-            return f'<h{level} id="{anchor}">{text}</h{level}>'
-
-        return _replacer
-
-    html = re.sub(r"^#### (.+)$", _heading_replacer(4), html, flags=re.MULTILINE)
-    html = re.sub(r"^### (.+)$", _heading_replacer(3), html, flags=re.MULTILINE)
-    html = re.sub(r"^## (.+)$", _heading_replacer(2), html, flags=re.MULTILINE)
-    html = re.sub(r"^# (.+)$", _heading_replacer(1), html, flags=re.MULTILINE)
-
-    # Horizontal rules
-    html = re.sub(r"^---+$", "<hr>", html, flags=re.MULTILINE)
-
-    # Bold & italic
-    html = re.sub(r"\*\*\*(.*?)\*\*\*", r"<strong><em>\1</em></strong>", html)
-    html = re.sub(r"\*\*(.*?)\*\*", r"<strong>\1</strong>", html)
-    html = re.sub(r"\*(.*?)\*", r"<em>\1</em>", html)
-
-    # Links — rewrite .md hrefs to .html
-    def _link_replacer(match):
-        text = match.group(1)
-        href = match.group(2)
+def _inline_replacer(match: re.Match) -> str:
+    """Render one inline Markdown token matched by ``_RE_INLINE``."""
+    kind = match.lastgroup
+    if kind == "code":
+        return f"<code>{match.group('code')}</code>"
+    if kind == "src":
+        return f'<img src="{match.group("src")}" alt="{match.group("alt")}">'
+    if kind == "href":
+        href = match.group("href")
         if href.endswith(".md"):
             href = href[:-3] + ".html"
         elif ".md#" in href:
             href = href.replace(".md#", ".html#")
-        return f'<a href="{href}">{text}</a>'
+        return f'<a href="{href}">{_render_inline(match.group("text"))}</a>'
+    inner = _render_inline(match.group(kind))
+    if kind == "bi":
+        return f"<strong><em>{inner}</em></strong>"
+    if kind == "b":
+        return f"<strong>{inner}</strong>"
+    return f"<em>{inner}</em>"
+
+
+def _render_table(rows: list[str]) -> str:
+    """Render a Markdown table (header, separator, body rows) as HTML."""
+    cells = [[c.strip() for c in row.strip("|").split("|")] for row in rows]
+    table_html = ['<div class="table-wrapper"><table><tr>']
+    table_html.extend(f"<th>{col}</th>" for col in cells[0])
+    table_html.append("</tr>")
+    for cols in cells[2:]:  # skip the separator row (e.g. |---|---|)
+        table_html.append("<tr>")
+        table_html.extend(f"<td>{col}</td>" for col in cols)
+        table_html.append("</tr>")
+    table_html.append("</table></div>")
+    return "".join(table_html)
+
+
+def _render_inline(text: str) -> str:
+    """Apply inline Markdown rules (emphasis, links, images, code) to prose.
+
+    A single scan over ``_RE_INLINE`` replaces one ``re.sub`` pass per rule.
+    Code spans are emitted verbatim; link and emphasis text is rendered
+    recursively so nested markup still works.
+    """
+    # Every rule starts with one of these; most text (link labels, plain
+    # emphasis) has none, and a substring check is cheaper than a regex scan
+    if "*" not in text and "[" not in text and "`" not in text:
+        return text
+    return _RE_INLINE.sub(_inline_replacer, text)
 
-    html = re.sub(r"\[([^\]]+)\]\(([^\)]+)\)", _link_replacer, html)
 
-    # Images
-    html = re.sub(r"!\[([^\]]*)\]\(([^\)]+)\)", r'<img src="\2" alt="\1">', html)
+def simple_md_to_html(md_content: str) -> tuple[str, list[dict]]:
+    """Convert Markdown content to HTML (subset parser, no dependencies).
 
-    # Unordered lists
-    html = re.sub(r"^\* (.+)$", r"<ul><li>\1</li></ul>", html, flags=re.MULTILINE)
-    html = re.sub(r"^- (.+)$", r"<ul><li>\1</li></ul>", html, flags=re.MULTILINE)
-    html = html.replace("</ul>\n<ul>", "\n")
+    Returns ``(html, toc)`` where *toc* lists the h2-h4 headings as
+    ``{"level", "text", "anchor"}`` dicts, collected during the same scan.
 
-    # Ordered lists (basic)
-    html = re.sub(r"^\d+\. (.+)$", r"<ol><li>\1</li></ol>", html, flags=re.MULTILINE)
-    html = html.replace("</ol>\n<ol>", "\n")
+    The document is scanned once, line by line.  Block-level constructs
+    (headings, rules, lists, blockquotes, tables, fenced code) are
+    recognised from the line prefix, with list nesting taken from the item
+    indentation; inline rules run once per prose chunk between fenced
+    blocks, so code is never rewritten.  A fence that is never closed is
+    kept as text and the lines after it are scanned again as Markdown.
+    """
+    # Escape HTML characters first
+    html = md_content.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
-    # Blockquotes
-    html = re.sub(
-        r"^&gt; (.+)$", r"<blockquote>\1</blockquote>", html, flags=re.MULTILINE
-    )
-    html = html.replace("</blockquote>\n<blockquote>", "\n")
-
-    # Fenced code blocks (with language class / mermaid support)
-    def _code_block_replacer(match):
-        lang = match.group(1) or ""
-        code = match.group(2)
-        if lang == "mermaid":
-            return f'<div class="mermaid">{code}</div>'
-        lang_attr = f' class="language-{lang}"' if lang else ""
-        return f"<pre><code{lang_attr}>{code}</code></pre>"
-
-    html = re.sub(r"```(\w*)\n([\s\S]*?)```", _code_block_replacer, html)
-
-    # Inline code
-    html = re.sub(r"`([^`]+)`", r"<code>\1</code>", html)
-
-    # Tables (basic pipe-delimited)
-    def _table_replacer(match):
-        rows = match.group(0).strip().split("\n")
-        table_html = '<div class="table-wrapper"><table>'
-        for i, row in enumerate(rows):
-            cols = [c.strip() for c in row.strip("|").split("|")]
-            # Skip separator row (e.g. |---|---|)
-            if i == 1 and all(set(c) <= set("-: ") for c in cols):
+    # Restore <details> / <summary> blocks (commonly used in wiki pages)
+    html = _RE_ESCAPED_DETAILS.sub(r"<\1>", html)
+
+    parts: list[str] = []  # finished HTML (rendered prose + code blocks)
+    toc: list[dict] = []
+    prose: list[str] = []  # block-rendered lines awaiting inline rules
+    table: list[str] = []  # consecutive "|"-prefixed lines
+    open_lists: list[tuple[str, int]] = []  # (tag, indent), innermost last
+    in_quote = False
+    fence_lang: str | None = None  # language of the open fence, if any
+    fence_buf: list[str] = []
+
+    def _close_lists(indent: int = -1) -> None:
+        # Close every open list nested deeper than *indent*; a nested list
+        # also closes the parent item it was opened in
+        while open_lists and open_lists[-1][1] > indent:
+            tag = open_lists.pop()[0]
+            prose[-1] += f"</{tag}></li>" if open_lists else f"</{tag}>"
+
+    def _close_block() -> None:
+        nonlocal in_quote
+        _close_lists()
+        if in_quote:
+            prose[-1] += "</blockquote>"
+            in_quote = False
+
+    def _flush_table() -> None:
+        # A run of "|" lines is a table from the first line followed by a
+        # separator row (and at least one body row) to the end of the run
+        if table:
+            for i in range(len(table) - 2):
+                if _RE_TABLE_SEP.fullmatch(table[i + 1]):
+                    table[i:] = [_render_table(table[i:])]
+                    break
+            prose.append("\n".join(table))
+            table.clear()
+
+    def _flush_prose() -> None:
+        if prose:
+            parts.append(_render_inline("\n".join(prose)))
+            prose.clear()
+
+    lines = html.split("\n")
+    fence_start = 0  # index of the line after the open fence's opener
+    i = 0
+    while True:
+        if i == len(lines):
+            if fence_lang is None:
+                break
+            # Unterminated fence: the opener is plain text and the lines after
+            # it are parsed as usual, so the rest of the page keeps its blocks
+            prose.append(f"```{fence_lang}")
+            fence_lang = None
+            fence_buf = []
+            i = fence_start
+            continue
+        line = lines[i]
+        i += 1
+
+        # Inside a fenced code block: collect verbatim until the closing fence
+        if fence_lang is not None:
+            if line.lstrip().startswith("```"):
+                code = "".join(f"{code_line}\n" for code_line in fence_buf)
+                if fence_lang == "mermaid":
+                    parts.append(f'<div class="mermaid">{code}</div>')
+                else:
+                    lang_attr = f' class="language-{fence_lang}"' if fence_lang else ""
+                    parts.append(f"<pre><code{lang_attr}>{code}</code></pre>")
+                fence_lang = None
+                fence_buf = []
+                prose.append("")
+            else:
+                fence_buf.append(line)
+            continue
+
+        first = line[:1]
+
+        if first == "|" and len(line) > 1 and line.endswith("|"):
+            _close_block()
+            table.append(line)
+            continue
+        _flush_table()
+
+        # Fenced code blocks (with language class / mermaid support)
+        stripped = line.lstrip()
+        if stripped.startswith("```") and _RE_FENCE_LANG.fullmatch(stripped, 3):
+            _close_block()
+            prose.append(line[: len(line) - len(stripped)])
+            _flush_prose()
+            fence_lang = stripped[3:]
+            fence_start = i
+            continue
+
+        # Headers — also inject anchors for TOC linking
+        if first == "#":
+            level = len(line) - len(line.lstrip("#"))
+            if level <= 4 and line[level : level + 1] == " " and line[level + 1 :]:
+                _close_block()
+                text = line[level + 1 :].strip()
+                anchor = _anchorize(text)
+                if level >= 2:
+                    toc.append({"level": level, "text": text, "anchor": anchor})
+                prose.append(f'<h{level} id="{anchor}">{text}</h{level}>')
+                continue
+
+        # Horizontal rules
+        elif first == "-" and len(line) >= 3 and not line.strip("-"):
+            _close_block()
+            prose.append("<hr>")
+            continue
+
+        # Blockquotes: open the container once, close it on the first line
+        # that does not continue it
+        if first == "&" and line.startswith("&gt; ") and line[5:]:
+            if in_quote:
+                prose.append(line[5:])
+            else:
+                _close_block()
+                prose.append(f"<blockquote>{line[5:]}")
+                in_quote = True
+            continue
+
+        # Lists: same idea, with one open list per indentation level
+        match = None
+        if first and (first in "*- \t" or first.isdigit()):
+            match = _RE_LIST_ITEM.fullmatch(line)
+        if match is None:
+            _close_block()
+            prose.append(line)
+            continue
+
+        indent = len(match.group(1).expandtabs(4))
+        kind = "ul" if match.group(2) in ("*", "-") else "ol"
+        item = match.group(3)
+        if in_quote:
+            _close_block()
+        _close_lists(indent)
+        if open_lists and open_lists[-1][1] == indent:
+            if open_lists[-1][0] == kind:
+                prose.append(f"<li>{item}</li>")
                 continue
-            tag = "th" if i == 0 else "td"
-            cells = "".join(f"<{tag}>{col}</{tag}>" for col in cols)
-            table_html += f"<tr>{cells}</tr>"
-        table_html += "</table></div>"
-        return table_html
+            # Switching between bullets and numbers at the same level
+            tag = open_lists.pop()[0]
+            prose[-1] += f"</{tag}></li>" if open_lists else f"</{tag}>"
+        if open_lists:
+            # Nest the new list inside the previous item: reopen its <li>
+            prose[-1] = prose[-1][: -len("</li>")]
+        prose.append(f"<{kind}><li>{item}</li>")
+        open_lists.append((kind, indent))
 
-    html = re.sub(r"\|.*\|\n\|[-:| ]+\|\n(\|.*\|\n?)+", _table_replacer, html)
+    _flush_table()
+    _close_block()
+    _flush_prose()
 
-    return html
+    return "".join(parts), toc
 
 
 # ---------------------------------------------------------------------------
-# Table of Contents extraction
+# Table of Contents
 # ---------------------------------------------------------------------------
 
 
-def extract_toc(md_content: str) -> list[dict]:
-    """Extract headings from Markdown content for table-of-contents generation."""
-    toc = []
-    for match in re.finditer(r"^(#{2,4})\s+(.+)$", md_content, re.MULTILINE):
-        level = len(match.group(1))
-        text = match.group(2).strip()
-        anchor = re.sub(r"[^\w\s-]", "", text.lower())
-        anchor = re.sub(r"\s+", "-", anchor).strip("-")
-        toc.append({"level": level, "text": text, "anchor": anchor})
-    return toc
-
-
 def build_toc_html(toc: list[dict]) -> str:
     """Generate HTML for the page table of contents."""
     if not toc:
@@ -181,40 +359,107 @@ def build_toc_html(toc: list[dict]) -> str:
 
 def extract_title(md_content: str, fallback: str) -> str:
     """Extract the first H1 heading from Markdown content as the page title."""
-    match = re.search(r"^#\s+(.+)$", md_content, re.MULTILINE)
+    match = _RE_TITLE.search(md_content)
     if match:
         return match.group(1).strip()
     return fallback
 
 
-def extract_text_content(md_content: str) -> str:
-    """Extract plain text from Markdown for search indexing."""
-    text = re.sub(r"```[\s\S]*?```", "", md_content)  # remove code blocks
-    text = re.sub(r"[#*`\[\]\(\)|>-]", " ", text)  # remove markdown syntax
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+def extract_text_content(md_content: str, limit: int | None = None) -> str:
+    """Extract plain text from Markdown for search indexing.
+
+    With ``limit``, only a bounded prefix of the document is scanned (widened
+    to close any code block it cuts through) and at most ``limit`` characters
+    are returned; the whole document is only scanned if the prefix is too
+    short to fill the limit.
+    """
+    if limit is not None and len(md_content) > limit * 4:
+        head = md_content[: limit * 4]
+        if head.count("```") % 2:
+            end = md_content.find("```", len(head) - 2)
+            head = md_content if end == -1 else md_content[: end + 3]
+        text = _strip_markdown(head)
+        if len(text) >= limit:
+            return text[:limit]
+    text = _strip_markdown(md_content)
+    return text if limit is None else text[:limit]
+
 
+def _strip_markdown(md_content: str) -> str:
+    """Drop code blocks and Markdown syntax, collapsing whitespace."""
+    text = _RE_CODEBLOCK_STRIP.sub("", md_content)  # remove code blocks
+    return _RE_MD_SYNTAX.sub(" ", text).strip()  # syntax + whitespace at once
 
+
+@functools.lru_cache(maxsize=2048)
 def slugify(name: str) -> str:
     """Turn a filename stem into a URL-friendly slug."""
-    return re.sub(r"[^\w-]", "-", name.lower()).strip("-")
+    name = name.lower()
+    if name.isascii():  # the common case: one table lookup per byte, in C
+        slug = name.encode("ascii").translate(_SLUG_ASCII_TABLE).decode("ascii")
+    else:
+        slug = _RE_SLUG.sub("-", name)
+    return slug.strip("-")
+
+
+def _read_markdown(path: Path) -> str:
+    """Read a Markdown source as text with ``\n`` line endings.
+
+    Decodes the raw bytes in one step instead of going through a text-mode
+    file object; newlines are normalised the way text mode would.
+    """
+    text = path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
-def _resolve_page(
-    stem_or_path: str, md_files: dict[str, Path]
-) -> tuple[str, Path] | None:
-    """Resolve a config page entry to a (key, Path) pair."""
+def _write_text(path: Path, text: str) -> None:
+    """Write *text* as UTF-8, encoding it in one step (see ``_read_markdown``)."""
+    path.write_bytes(text.encode("utf-8"))
+
+
+def _resolve_page(stem: str, md_files: dict[str, Path]) -> tuple[str, Path] | None:
+    """Resolve a config page entry (without ".md") to a (key, Path) pair.
+
+    *md_files* is keyed by the POSIX relative path without extension, so
+    both lookups are plain dict hits with no Path construction.
+    """
     # Try exact path first (e.g. "modules/auth-module")
-    clean = stem_or_path.replace(".md", "")
-    if clean in md_files:
-        return clean, md_files[clean]
-    # Try just the stem (basename without directory)
-    stem = Path(clean).stem
     if stem in md_files:
         return stem, md_files[stem]
+    # Try just the basename (a top-level page with the same name)
+    name = stem.rpartition("/")[2]
+    if name in md_files:
+        return name, md_files[name]
     return None
 
 
+def _find_md_files(root: Path) -> dict[str, Path]:
+    """Find every ``.md`` file under *root*, keyed by relative path sans ``.md``.
+
+    Walks the tree with ``os.scandir`` so entry types come from the directory
+    listing and only Markdown files become ``Path`` objects. Like
+    ``Path.rglob``, symlinked directories are not descended into (so a link
+    back up the tree cannot loop), symlinked files are included, and
+    directories that cannot be listed (e.g. no read permission) are skipped.
+    """
+    md_files: dict[str, Path] = {}
+    pending = [("", str(root))]  # (key prefix, directory)
+    while pending:
+        prefix, directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((f"{prefix}{entry.name}/", entry.path))
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        md_files[prefix + entry.name[:-3]] = Path(entry.path)
+        except OSError:
+            continue
+    return md_files
+
+
 def discover_pages(
     input_dir: str, config: dict | None = None
 ) -> tuple[list[dict], list[dict] | None]:
@@ -223,27 +468,22 @@ def discover_pages(
       - An ordered list of page metadata dicts
       - A list of section dicts for hierarchical nav (or None for flat nav)
 
-    Page dict keys: md_path, html_name, title, slug, rel_path, section_path
+    Page dict keys: md_path, html_name, title, slug, rel_path, section_path,
+                    content (the decoded Markdown source, read once here)
     Section dict keys: title, pages (list of slugs), subsections (list of section dicts)
     """
     input_path = Path(input_dir)
-    md_files: dict[str, Path] = {}
-
-    # Recursively discover all .md files
-    for p in sorted(input_path.rglob("*.md")):
-        # Use relative path (without extension) as the key
-        rel = p.relative_to(input_path)
-        key = str(rel.with_suffix(""))
-        md_files[key] = p
+    # Unordered; only the pages not placed by the config need sorting, below
+    md_files = _find_md_files(input_path)
 
     pages: list[dict] = []
     seen: set[str] = set()
     sections: list[dict] | None = None
 
     def _make_page(key: str, md_path: Path, title_override: str | None = None) -> dict:
-        content = md_path.read_text(encoding="utf-8")
+        content = _read_markdown(md_path)
         rel = md_path.relative_to(input_path)
-        html_name = str(rel.with_suffix(".html"))
+        html_name = rel.with_suffix(".html").as_posix()
         title = title_override or extract_title(content, md_path.stem)
         slug = slugify(key)
         section_path = str(rel.parent) if str(rel.parent) != "." else ""
@@ -254,8 +494,34 @@ def discover_pages(
             "slug": slug,
             "rel_path": str(rel),
             "section_path": section_path,
+            "content": content,
         }
 
+    def _add_config_entry(entry: str | dict) -> dict | None:
+        """Add the page a config entry names; return it if it was newly added.
+
+        An entry is a file name or ``{"file": ..., "title": ...}``; the title
+        override, when given, also spares the heading search.
+        """
+        if isinstance(entry, str):
+            stem = entry.removesuffix(".md")
+            title_override = None
+        else:
+            stem = entry["file"].removesuffix(".md")
+            title_override = entry.get("title")
+
+        resolved = _resolve_page(stem, md_files)
+        if resolved is None:
+            print(f"Warning: config references '{stem}.md' but file not found")
+            return None
+        key, md_path = resolved
+        if key in seen:
+            return None
+        page = _make_page(key, md_path, title_override)
+        pages.append(page)
+        seen.add(key)
+        return page
+
     def _process_section_config(section_cfg: dict) -> dict:
         """Process a section from config and return a section dict with page slugs."""
         section = {
@@ -265,23 +531,9 @@ def discover_pages(
         }
 
         for entry in section_cfg.get("pages", []):
-            if isinstance(entry, str):
-                stem = entry.replace(".md", "")
-                title_override = None
-            else:
-                stem = entry["file"].replace(".md", "")
-                title_override = entry.get("title")
-
-            resolved = _resolve_page(stem, md_files)
-            if resolved:
-                key, md_path = resolved
-                if key not in seen:
-                    page = _make_page(key, md_path, title_override)
-                    pages.append(page)
-                    section["pages"].append(page["slug"])
-                    seen.add(key)
-            else:
-                print(f"Warning: config references '{stem}.md' but file not found")
+            page = _add_config_entry(entry)
+            if page:
+                section["pages"].append(page["slug"])
 
         for sub_cfg in section_cfg.get("subsections", []):
             section["subsections"].append(_process_section_config(sub_cfg))
@@ -299,26 +551,11 @@ def discover_pages(
         # Flat config (pages key only)
         elif "pages" in config:
             for entry in config["pages"]:
-                if isinstance(entry, str):
-                    stem = entry.replace(".md", "")
-                    title_override = None
-                else:
-                    stem = entry["file"].replace(".md", "")
-                    title_override = entry.get("title")
-
-                resolved = _resolve_page(stem, md_files)
-                if resolved:
-                    key, md_path = resolved
-                    if key not in seen:
-                        pages.append(_make_page(key, md_path, title_override))
-                        seen.add(key)
-                else:
-                    print(f"Warning: config references '{stem}.md' but file not found")
+                _add_config_entry(entry)
 
-    # Append any remaining .md files not covered by config
-    for key, md_path in md_files.items():
-        if key in seen:
-            continue
+    # Append any remaining .md files not covered by config, in path order
+    remaining = [(md_path, key) for key, md_path in md_files.items() if key not in seen]
+    for md_path, key in sorted(remaining):
         pages.append(_make_page(key, md_path))
 
     # --- Auto-generate sections from directory structure ---
@@ -374,114 +611,119 @@ def discover_pages(
 # ---------------------------------------------------------------------------
 
 
-def relative_href(from_html: str, to_html: str) -> str:
-    """Compute the relative URL from one HTML page to another.
+# Placeholder for the path back to the wiki root inside nav templates
+_NAV_ROOT = "\x00ROOT\x00"
 
-    Both paths are relative to the wiki output root.
-    Example: relative_href("modules/auth.html", "overview.html") -> "../overview.html"
-    """
-    from_parts = Path(from_html).parent.parts
-    to_path = Path(to_html)
-    prefix = "/".join([".."] * len(from_parts)) if from_parts else ""
-    if prefix:
-        return f"{prefix}/{to_path}"
-    return str(to_path)
+
+def _nav_link(page: dict) -> str:
+    """Render a sidebar link for *page* with a root-relative href placeholder."""
+    return (
+        f'<a href="{_NAV_ROOT}{page["html_name"]}" data-slug="{page["slug"]}">'
+        f"{page['title']}</a>"
+    )
 
 
-def build_flat_nav_html(pages: list[dict], active_slug: str, current_html: str) -> str:
-    """Generate a flat sidebar navigation HTML."""
+def build_flat_nav_html(pages: list[dict]) -> str:
+    """Generate the flat sidebar navigation template (see ``activate_nav``)."""
     items: list[str] = []
     for page in pages:
-        active = ' class="active"' if page["slug"] == active_slug else ""
-        href = relative_href(current_html, page["html_name"])
-        items.append(f'<li><a href="{href}"{active}>{page["title"]}</a></li>')
+        items.append(f"<li>{_nav_link(page)}</li>")
     return "\n            ".join(items)
 
 
+def _index_sections(
+    sections: list[dict] | None,
+) -> dict[str, tuple[list[str], list[int]]]:
+    """Walk the section tree once and locate every sectioned page.
+
+    Maps each page slug to ``(trail, section_ids)``: the titles of the
+    sections leading to the page (for breadcrumbs) and the depth-first ids
+    of those sections (matching ``data-section`` in the nav template).
+    """
+    index: dict[str, tuple[list[str], list[int]]] = {}
+    section_ids = itertools.count()
+
+    def _walk(secs: list[dict], trail: list[str], ancestors: list[int]) -> None:
+        for sec in secs:
+            sec_trail = trail + [sec["title"]]
+            sec_ids = ancestors + [next(section_ids)]
+            for slug in sec["pages"]:
+                index.setdefault(slug, (sec_trail, sec_ids))
+            _walk(sec.get("subsections", []), sec_trail, sec_ids)
+
+    _walk(sections or [], [], [])
+    return index
+
+
 def build_hierarchical_nav_html(
-    sections: list[dict], pages: list[dict], active_slug: str, current_html: str
+    sections: list[dict],
+    pages: list[dict],
+    section_index: dict[str, tuple[list[str], list[int]]],
 ) -> str:
-    """Generate hierarchical sidebar navigation with collapsible sections."""
-    page_map = {p["slug"]: p for p in pages}
+    """Generate the hierarchical sidebar navigation template (see ``activate_nav``).
 
-    def _render_section(section: dict, depth: int = 0) -> str:
-        # Check if active page is in this section (including subsections)
-        def _contains_active(sec: dict) -> bool:
-            if active_slug in sec["pages"]:
-                return True
-            return any(_contains_active(sub) for sub in sec.get("subsections", []))
+    Sections are numbered depth-first via ``data-section`` so the ones that
+    contain the current page can be opened per page.
+    """
+    page_map = {p["slug"]: p for p in pages}
+    section_ids = itertools.count()
+    parts: list[str] = []  # shared by every section, joined once at the end
 
-        is_open = _contains_active(section)
-        open_attr = " open" if is_open else ""
+    def _render_section(section: dict, depth: int = 0) -> None:
+        section_id = next(section_ids)
         indent = "  " * depth
 
-        html = f'{indent}<li class="nav-section">\n'
-        html += f"{indent}  <details{open_attr}>\n"
-        html += f'{indent}    <summary class="nav-section-title">{section["title"]}</summary>\n'
-        html += f'{indent}    <ul class="nav-section-pages">\n'
-
-        for slug in section["pages"]:
-            if slug in page_map:
-                page = page_map[slug]
-                active = ' class="active"' if slug == active_slug else ""
-                href = relative_href(current_html, page["html_name"])
-                html += (
-                    f'{indent}      <li><a href="{href}"{active}>'
-                    f"{page['title']}</a></li>\n"
-                )
-
+        parts.append(
+            f'{indent}<li class="nav-section">\n'
+            f'{indent}  <details data-section="{section_id}">\n'
+            f'{indent}    <summary class="nav-section-title">{section["title"]}</summary>\n'
+            f'{indent}    <ul class="nav-section-pages">\n'
+        )
+        parts.extend(
+            f"{indent}      <li>{_nav_link(page_map[slug])}</li>\n"
+            for slug in section["pages"]
+            if slug in page_map
+        )
         for sub in section.get("subsections", []):
-            html += _render_section(sub, depth + 1)
+            _render_section(sub, depth + 1)
+        parts.append(f"{indent}    </ul>\n{indent}  </details>\n{indent}</li>\n")
 
-        html += f"{indent}    </ul>\n"
-        html += f"{indent}  </details>\n"
-        html += f"{indent}</li>\n"
-        return html
-
-    items = []
     for section in sections:
-        items.append(_render_section(section))
+        _render_section(section)
 
     # Render any pages not in sections
-    sectioned_slugs = set()
-
-    def _collect_slugs(sec):
-        sectioned_slugs.update(sec["pages"])
-        for sub in sec.get("subsections", []):
-            _collect_slugs(sub)
-
-    for sec in sections:
-        _collect_slugs(sec)
-
     for page in pages:
-        if page["slug"] not in sectioned_slugs:
-            active = ' class="active"' if page["slug"] == active_slug else ""
-            href = relative_href(current_html, page["html_name"])
-            items.append(f'<li><a href="{href}"{active}>{page["title"]}</a></li>\n')
+        if page["slug"] not in section_index:
+            parts.append(f"<li>{_nav_link(page)}</li>\n")
 
-    return "".join(items)
+    return "".join(parts)
 
 
-def build_breadcrumbs(page: dict, sections: list[dict] | None) -> str:
-    """Generate breadcrumb navigation HTML for a page."""
-    if not sections:
-        return ""
+@functools.lru_cache(maxsize=16)
+def _nav_at_root(nav_template: str, root_prefix: str) -> str:
+    """Fill in the root path of a nav template (shared by pages at one depth)."""
+    return nav_template.replace(_NAV_ROOT, root_prefix)
 
-    # Find the section path to this page
-    path: list[str] = []
 
-    def _find_in_sections(secs: list[dict], slug: str, trail: list[str]) -> bool:
-        for sec in secs:
-            current_trail = trail + [sec["title"]]
-            if slug in sec["pages"]:
-                path.extend(current_trail)
-                return True
-            if _find_in_sections(sec.get("subsections", []), slug, current_trail):
-                return True
-        return False
-
-    _find_in_sections(sections, page["slug"], [])
+def activate_nav(nav_template: str, current_page: dict) -> str:
+    """Specialise a sidebar navigation template for *current_page*.
 
+    Fills in the relative path back to the wiki root (once per directory
+    depth), marks the current page's link as active and opens the sections
+    that contain it.
+    """
+    nav = _nav_at_root(nav_template, current_page["root_prefix"])
+    marker = f'data-slug="{current_page["slug"]}"'
+    nav = nav.replace(marker, f'{marker} class="active"', 1)
+    for section_id in current_page["open_sections"]:
+        marker = f'<details data-section="{section_id}"'
+        nav = nav.replace(marker, f"{marker} open", 1)
+    return nav
+
+
+def build_breadcrumbs(page: dict) -> str:
+    """Generate breadcrumb navigation HTML for a page (from its section trail)."""
+    path = page["section_trail"]
     if not path:
         return ""
 
@@ -503,30 +745,95 @@ def build_breadcrumbs(page: dict, sections: list[dict] | None) -> str:
     return f'<nav class="breadcrumbs">{"".join(crumbs)}</nav>'
 
 
+def _trigrams(text: str) -> dict[str, None]:
+    """Return every 3-character substring of *text*, in first-seen order.
+
+    A dict rather than a set so the index (and the output) is identical from
+    one build to the next regardless of string hash randomization.
+    """
+    return dict.fromkeys(text[i : i + 3] for i in range(len(text) - 2))
+
+
+# Digits for encoded postings: the first 32 end a number, the last 32 continue it
+_POSTING_DIGITS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+def _encode_postings(page_ids: list[int]) -> str:
+    """Encode ascending page ids as a compact string (decoded by search.js).
+
+    Each id is stored as its gap to the previous one, minus one, in base 32,
+    most significant digit first; with a few hundred pages nearly every gap
+    fits a single character.
+    """
+    encoded = []
+    previous = -1
+    for page_id in page_ids:
+        gap = page_id - previous - 1
+        previous = page_id
+        digits = _POSTING_DIGITS[gap & 31]
+        gap >>= 5
+        while gap:
+            digits = _POSTING_DIGITS[32 + (gap & 31)] + digits
+            gap >>= 5
+        encoded.append(digits)
+    return "".join(encoded)
+
+
 def build_search_index(pages: list[dict]) -> str:
-    """Build a JavaScript search index from all pages."""
-    index = []
-    for page in pages:
-        content = page["md_path"].read_text(encoding="utf-8")
-        text = extract_text_content(content)
-        # Truncate to keep index manageable
-        text = text[:3000]
-        index.append(
-            {
-                "title": page["title"],
-                "url": page["html_name"],
-                "text": text,
-            }
-        )
-    return json.dumps(index, ensure_ascii=False)
+    """Build the search index script shared by all pages (``search-index.js``).
+
+    The index is stored column-wise (parallel ``titles`` / ``urls`` / ``texts``
+    arrays) rather than as one object per page, which avoids repeating the
+    keys for every page. ``grams`` is an inverted index from each lowercase
+    trigram to the ids of the pages containing it (see ``_encode_postings``),
+    so the client only scans pages that contain every trigram of the query.
+    Serialized without whitespace, with ``orjson`` when it is installed and
+    the standard library (producing the same bytes) otherwise.
+    """
+    titles = [page["title"] for page in pages]
+    # Truncate to keep index manageable
+    texts = [extract_text_content(page["content"], 3000) for page in pages]
+    grams: dict[str, list[int]] = {}
+    for page_id, (title, text) in enumerate(zip(titles, texts)):
+        for gram in _trigrams(title.lower()) | _trigrams(text.lower()):
+            grams.setdefault(gram, []).append(page_id)  # ids stay ascending
+    index = {
+        "titles": titles,
+        "urls": [page["html_name"] for page in pages],
+        "texts": texts,
+        "grams": {gram: _encode_postings(ids) for gram, ids in grams.items()},
+    }
+    if orjson is not None:
+        index_json = orjson.dumps(index).decode("utf-8")
+    else:
+        index_json = json.dumps(index, ensure_ascii=False, separators=(",", ":"))
+    return f"window.__wikiSearchIndex = {index_json};\n"
 
 
+@functools.cache
 def _load_asset(filename: str) -> str:
-    """Read a static asset file from the assets directory."""
+    """Read a static asset file from the assets directory (cached per process)."""
     path = _ASSETS_DIR / filename
     return path.read_text(encoding="utf-8")
 
 
+@functools.cache
+def _load_minified_asset(filename: str) -> str:
+    """Read a CSS or JS asset with comments and layout whitespace removed.
+
+    Deliberately conservative: CSS loses comments and the whitespace around
+    ``{};,``; JS only loses comment-only lines and indentation, keeping line
+    breaks so automatic semicolon insertion behaves exactly as before.
+    """
+    text = _load_asset(filename)
+    if filename.endswith(".css"):
+        text = _RE_CSS_PUNCT.sub(r"\1", _RE_CSS_COMMENT.sub("", text))
+        return _RE_WS.sub(" ", text).replace(";}", "}").strip()
+    lines = (line.strip() for line in _RE_JS_COMMENT_BLOCK.sub("", text).split("\n"))
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+@functools.cache
 def get_nvidia_logo_svg() -> str:
     """Return the NVIDIA logo SVG with the 'nvidia-logo' class attribute."""
     svg = _load_asset("nvidia-logo.svg").strip()
@@ -535,95 +842,61 @@ def get_nvidia_logo_svg() -> str:
 
 
 def get_css() -> str:
-    """Return the complete CSS for the wiki site (loaded from assets/wiki.css)."""
-    return _load_asset("wiki.css")
+    """Return the complete CSS for the wiki site (minified assets/wiki.css)."""
+    return _load_minified_asset("wiki.css")
 
 
-def get_search_script(search_index_json: str, base_prefix: str = "") -> str:
-    """Return the JavaScript for client-side search.
+def get_site_js() -> str:
+    """Return the client-side JavaScript shared by all pages (``assets/wiki.js``).
 
-    *base_prefix* is prepended to search-result URLs so that pages in
-    subdirectories link correctly (e.g. ``../`` for a page one level deep).
+    Bundles the search and Mermaid lightbox scripts. Search reads the path
+    back to the wiki root from ``window.__wikiBasePrefix``, set inline by
+    each page: ``search-index.js`` is loaded from there on first use and
+    result URLs are prefixed with it.
     """
-    search_js = _load_asset("search.js")
-    # Inject the search index and base prefix as globals before the IIFE
     return (
-        "<script>\n"
-        f"window.__wikiSearchIndex = {search_index_json};\n"
-        f'window.__wikiBasePrefix = "{base_prefix}";\n'
-        f"{search_js}\n"
-        "</script>"
+        _load_minified_asset("search.js")
+        + "\n"
+        + _load_minified_asset("mermaid-lightbox.js")
     )
 
 
-def render_page(
-    md_content: str,
-    title: str,
-    pages: list[dict],
-    active_slug: str,
-    project_title: str,
-    lang: str,
-    sections: list[dict] | None,
-    current_page: dict,
-    search_index_json: str,
-) -> str:
-    """Render a full HTML page with sidebar, breadcrumbs, TOC, and search."""
-    current_html = current_page["html_name"]
-
-    # Navigation
-    if sections:
-        nav_html = build_hierarchical_nav_html(
-            sections, pages, active_slug, current_html
-        )
-    else:
-        nav_html = build_flat_nav_html(pages, active_slug, current_html)
-
-    # Breadcrumbs
-    breadcrumbs_html = build_breadcrumbs(current_page, sections)
-
-    # Table of contents
-    toc = extract_toc(md_content)
-    toc_html = build_toc_html(toc)
-
-    # Body content
-    body_html = simple_md_to_html(md_content)
-
-    # Search script — compute path prefix for relative URLs
-    depth = len(Path(current_html).parent.parts)
-    search_base_prefix = "/".join([".."] * depth) + "/" if depth > 0 else ""
-    search_script = get_search_script(search_index_json, search_base_prefix)
-
-    # TOC sidebar
-    toc_aside = ""
-    if toc_html:
-        toc_aside = f"""
-        <aside class="toc">
-            <div class="toc-title">On this page</div>
-            {toc_html}
-        </aside>"""
-
-    # Load static assets
-    css = get_css()
-    logo_svg = get_nvidia_logo_svg()
-    lightbox_js = _load_asset("mermaid-lightbox.js")
-    home_href = relative_href(current_html, "index.html")
-
-    return f"""<!DOCTYPE html>
+# Mermaid loader, only emitted on pages that contain diagrams. Each diagram is
+# rendered when it gets near the viewport rather than all of them on load.
+_MERMAID_SCRIPT = """
+    <script type="module">
+      import mermaid from 'https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.esm.min.mjs';
+      mermaid.initialize({ startOnLoad: false });
+      const diagrams = document.querySelectorAll('.mermaid');
+      if ('IntersectionObserver' in window) {
+        const observer = new IntersectionObserver((entries) => {
+          for (const entry of entries) {
+            if (entry.isIntersecting) {
+              observer.unobserve(entry.target);
+              mermaid.run({ nodes: [entry.target] });
+            }
+          }
+        }, { rootMargin: '200px' });
+        diagrams.forEach((node) => observer.observe(node));
+      } else {
+        await mermaid.run({ nodes: diagrams });
+      }
+    </script>"""
+
+# HTML shell shared by all pages. {logo_svg} is filled in once by
+# _page_chunks(); the remaining fields per page. CSS and JS live in the
+# shared assets/ directory of the output (see build_wiki).
+_PAGE_TEMPLATE = """<!DOCTYPE html>
 <html lang="{lang}">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title} - {project_title}</title>
-    <style>{css}</style>
-    <script type="module">
-      import mermaid from 'https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.esm.min.mjs';
-      mermaid.initialize({{ startOnLoad: true }});
-      await mermaid.run();
-    </script>
+    <link rel="stylesheet" href="{root_prefix}assets/wiki.css">{mermaid_script}
 </head>
 <body>
     <header class="top-bar">
-        <a class="top-bar-brand" href="{home_href}">
+        <a class="top-bar-brand" href="{root_prefix}index.html">
             {logo_svg}
             <span class="top-bar-title">{project_title}</span>
         </a>
@@ -650,14 +923,77 @@ def render_page(
     <div class="mermaid-overlay" id="mermaid-overlay">
         <div class="mermaid-overlay-content" id="mermaid-overlay-content"></div>
     </div>
-    {search_script}
-    <script>
-{lightbox_js}
-    </script>
+    <script>window.__wikiBasePrefix = "{root_prefix}";</script>
+    <script src="{root_prefix}assets/wiki.js"></script>
 </body>
 </html>"""
 
 
+@functools.cache
+def _page_chunks() -> tuple[str, ...]:
+    """Split ``_PAGE_TEMPLATE`` into literal text and per-page field names.
+
+    Even positions hold literal HTML (with the logo already inlined), odd
+    positions the names of the fields filled in per page, so rendering a
+    page is a single join.
+    """
+    static = {"logo_svg": get_nvidia_logo_svg()}
+    chunks = [""]
+    for literal, field, _, _ in string.Formatter().parse(_PAGE_TEMPLATE):
+        chunks[-1] += literal
+        if field in static:
+            chunks[-1] += static[field]
+        elif field is not None:
+            chunks.extend([field, ""])
+    return tuple(chunks)
+
+
+def render_page(
+    md_content: str,
+    title: str,
+    nav_template: str,
+    project_title: str,
+    lang: str,
+    current_page: dict,
+) -> str:
+    """Render a full HTML page with sidebar, breadcrumbs, TOC, and search."""
+    # Navigation (the template is shared by all pages)
+    nav_html = activate_nav(nav_template, current_page)
+
+    # Breadcrumbs
+    breadcrumbs_html = build_breadcrumbs(current_page)
+
+    # Body content and table of contents (collected in the same pass)
+    body_html, toc = simple_md_to_html(md_content)
+    toc_html = build_toc_html(toc)
+
+    # TOC sidebar
+    toc_aside = ""
+    if toc_html:
+        toc_aside = f"""
+        <aside class="toc">
+            <div class="toc-title">On this page</div>
+            {toc_html}
+        </aside>"""
+
+    fields = {
+        "lang": lang,
+        "title": title,
+        "project_title": project_title,
+        "root_prefix": current_page["root_prefix"],
+        "mermaid_script": (
+            _MERMAID_SCRIPT if '<div class="mermaid">' in body_html else ""
+        ),
+        "nav_html": nav_html,
+        "breadcrumbs_html": breadcrumbs_html,
+        "body_html": body_html,
+        "toc_aside": toc_aside,
+    }
+    chunks = list(_page_chunks())
+    chunks[1::2] = [fields[name] for name in chunks[1::2]]
+    return "".join(chunks)
+
+
 # ---------------------------------------------------------------------------
 # Main build logic
 # ---------------------------------------------------------------------------
@@ -671,8 +1007,100 @@ def load_config(config_path: str | None) -> dict | None:
     if not path.exists():
         print(f"Warning: config file '{config_path}' not found, ignoring")
         return None
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return json.loads(path.read_bytes())
+
+
+def _render_one(
+    page: dict,
+    nav_template: str,
+    project_title: str,
+    lang: str,
+) -> tuple[str, bytes]:
+    """Render one page and return ``(html_name, utf-8 encoded html)``.
+
+    Defined at module level so it can be dispatched to worker processes;
+    encoding here leaves only raw I/O for the writer threads.
+    """
+    html_content = render_page(
+        md_content=page["content"],
+        title=page["title"],
+        nav_template=nav_template,
+        project_title=project_title,
+        lang=lang,
+        current_page=page,
+    )
+    return page["html_name"], html_content.encode("utf-8")
+
+
+# Shared render inputs, set once per worker process by _init_render_worker
+_worker_shared: tuple[str, str, str, Path] | None = None
+
+
+def _init_render_worker(
+    nav_template: str, project_title: str, lang: str, output: Path
+) -> None:
+    """Store the inputs shared by every page in a worker process.
+
+    Sent once per worker rather than pickled alongside every page.
+    """
+    global _worker_shared
+    _worker_shared = (nav_template, project_title, lang, output)
+
+
+def _render_in_worker(page: dict) -> str:
+    """Render and write one page in a worker set up by ``_init_render_worker``.
+
+    Writing here keeps the rendered HTML out of the result pipe; only the
+    page name travels back to the parent.
+    """
+    nav_template, project_title, lang, output = _worker_shared
+    html_name, html_bytes = _render_one(page, nav_template, project_title, lang)
+    (output / html_name).write_bytes(html_bytes)
+    return html_name
+
+
+def _shared_digest(nav_template: str, project_title: str, lang: str) -> str:
+    """Hash the inputs shared by every page, including this script."""
+    digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    for part in (
+        nav_template,
+        project_title,
+        lang,
+        get_nvidia_logo_svg(),
+    ):
+        digest.update(part.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def _search_index_digest(pages: list[dict]) -> str:
+    """Hash everything the search index depends on, including this script."""
+    digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    for page in pages:
+        for part in (page["title"], page["html_name"], page["content"]):
+            digest.update(part.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def _page_digest(page: dict, shared_digest: str) -> str:
+    """Hash everything a rendered page depends on."""
+    digest = hashlib.blake2b(shared_digest.encode("ascii"), digest_size=16)
+    for part in (
+        page["content"],
+        page["title"],
+        *page["section_trail"],
+        *map(str, page["open_sections"]),
+    ):
+        digest.update(part.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def _load_manifest(path: Path) -> dict[str, str]:
+    """Load the previous build's ``{output name: digest}`` map (empty if unusable)."""
+    try:
+        manifest = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
 
 
 def build_wiki(
@@ -681,10 +1109,16 @@ def build_wiki(
     project_title: str = "Codebase Wiki",
     lang: str = "en",
     config: dict | None = None,
+    jobs: int | None = None,
+    force: bool = False,
 ) -> None:
     """
     Main entry point: discover pages, convert to HTML, write output.
 
+    Pages (and the search index) whose inputs are unchanged since the last
+    build, according to the manifest in the output directory, are not
+    regenerated.
+
     Parameters
     ----------
     input_dir : str
@@ -697,6 +1131,12 @@ def build_wiki(
         HTML lang attribute (e.g. "en", "zh-CN").
     config : dict | None
         Optional config dict (from JSON) with page ordering / section hierarchy.
+    jobs : int | None
+        Number of worker processes used to render pages. Defaults to the CPU
+        count; ``1`` renders everything in the current process. Small wikis
+        are always rendered in-process.
+    force : bool
+        Regenerate every page and the search index, ignoring the build manifest.
     """
     output = Path(output_dir) if output_dir else Path(input_dir) / "html"
     output.mkdir(parents=True, exist_ok=True)
@@ -715,39 +1155,100 @@ def build_wiki(
         print(f"Sections: {len(sections)} top-level section(s)")
     print()
 
-    # Build search index once
-    search_index_json = build_search_index(pages)
-
+    # Shared CSS / JS and the search index are written once and referenced
+    # by every page; the sidebar navigation is also built once for all pages
+    assets_dir = output / "assets"
+    assets_dir.mkdir(exist_ok=True)
+    _write_text(assets_dir / "wiki.css", get_css())
+    _write_text(assets_dir / "wiki.js", get_site_js())
+
+    # Skip outputs whose inputs are identical to the last build
+    manifest_path = output / _MANIFEST_NAME
+    previous = {} if force else _load_manifest(manifest_path)
+    search_index_path = output / "search-index.js"
+    index_digest = _search_index_digest(pages)
+    if (
+        previous.get(search_index_path.name) != index_digest
+        or not search_index_path.exists()
+    ):
+        _write_text(search_index_path, build_search_index(pages))
+    # Locate every page in the section tree once (breadcrumbs, open sections)
+    section_index = _index_sections(sections)
     for page in pages:
-        md_content = page["md_path"].read_text(encoding="utf-8")
+        page["section_trail"], page["open_sections"] = section_index.get(
+            page["slug"], ([], [])
+        )
+        # Path back to the wiki root (nav links, search, home link); output
+        # paths are POSIX and relative to the root, so only the depth matters
+        page["root_prefix"] = "../" * page["html_name"].count("/")
 
-        html_content = render_page(
-            md_content=md_content,
-            title=page["title"],
-            pages=pages,
-            active_slug=page["slug"],
+    if sections:
+        nav_template = build_hierarchical_nav_html(sections, pages, section_index)
+    else:
+        nav_template = build_flat_nav_html(pages)
+
+    # Pages whose rendered output would be identical to the last build
+    shared_digest = _shared_digest(nav_template, project_title, lang)
+    digests = {page["html_name"]: _page_digest(page, shared_digest) for page in pages}
+    stale = [
+        page
+        for page in pages
+        if previous.get(page["html_name"]) != digests[page["html_name"]]
+        or not (output / page["html_name"]).exists()
+    ]
+
+    # Create output subdirectories up front so writes are pure I/O
+    for subdir in {Path(page["html_name"]).parent for page in stale}:
+        (output / subdir).mkdir(parents=True, exist_ok=True)
+
+    # Pages are independent once the shared inputs exist, so larger wikis are
+    # rendered (and written) by worker processes; results come back in page
+    # order either way
+    workers = jobs or os.cpu_count() or 1
+    if workers > 1 and len(stale) >= _PARALLEL_MIN_PAGES:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=(nav_template, project_title, lang, output),
+        ) as executor:
+            # A few batches per worker: fewer round trips, still load-balanced
+            chunksize = max(1, len(stale) // (workers * 4))
+            written = executor.map(_render_in_worker, stale, chunksize=chunksize)
+            for page, html_name in zip(stale, written):
+                print(f"  ✓ {html_name:40s}  ({page['title']})")
+    else:
+        render = functools.partial(
+            _render_one,
+            nav_template=nav_template,
             project_title=project_title,
             lang=lang,
-            sections=sections,
-            current_page=page,
-            search_index_json=search_index_json,
         )
+        # Writes release the GIL, so they overlap with rendering the next page
+        with ThreadPoolExecutor(max_workers=_WRITE_THREADS) as writer:
+            writes = []
+            for page, (html_name, html_bytes) in zip(stale, map(render, stale)):
+                writes.append(
+                    writer.submit((output / html_name).write_bytes, html_bytes)
+                )
+                print(f"  ✓ {html_name:40s}  ({page['title']})")
+            for write in writes:
+                write.result()  # surface any write error
 
-        # Ensure output subdirectories exist
-        html_path = output / page["html_name"]
-        html_path.parent.mkdir(parents=True, exist_ok=True)
-        html_path.write_text(html_content, encoding="utf-8")
-        print(f"  ✓ {page['html_name']:40s}  ({page['title']})")
+    if len(stale) < len(pages):
+        print(f"  · {len(pages) - len(stale)} unchanged page(s) skipped")
+    # Only recorded once every page has been written successfully
+    digests[search_index_path.name] = index_digest
+    _write_text(manifest_path, json.dumps(digests))
 
     # Generate an index.html that redirects to the first page
     if pages:
         first_page = pages[0]["html_name"]
         index_path = output / "index.html"
-        index_path.write_text(
+        _write_text(
+            index_path,
             f"<!DOCTYPE html><html><head>"
             f'<meta http-equiv="refresh" content="0;url={first_page}">'
             f'</head><body><a href="{first_page}">Go to wiki</a></body></html>',
-            encoding="utf-8",
         )
         print(f"  ✓ {'index.html':40s}  (redirect -> {first_page})")
 
@@ -793,6 +1294,18 @@ Examples:
         default=None,
         help="Path to a JSON config file for section hierarchy and metadata",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for rendering pages (default: CPU count; 1 disables)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every page and the search index, even if unchanged since the last build",
+    )
 
     args = parser.parse_args()
 
@@ -819,6 +1332,8 @@ Examples:
         project_title=args.title,
         lang=args.lang,
         config=config,
+        jobs=args.jobs,
+        force=args.force,
     )
 
 